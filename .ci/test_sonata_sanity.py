@@ -15,8 +15,8 @@
 import morphio
 import os
 import brain_indexer
+from brain_indexer.morphology_builder import _quaternion_to_rotation_matrix
 import numpy as np
-import quaternion as npq
 CIRCUIT_2K = "tests/data/tiny_circuits/circuit-10/"
 INDEX_DIR = CIRCUIT_2K + "indexes/morphology/in_memory"
 MORPHOLOGY_DIR = CIRCUIT_2K + "morphologies/ascii/"
@@ -32,12 +32,9 @@ def remove_somas(d):
 
 
 def rototranslate(xyz, model):
-    # npq requries quaternion in the order: (w, x, y, z)
+    # The quaternion is given in the order: (w, x, y, z)
     position, rotation = model
-    points = npq.rotate_vectors(
-        npq.quaternion(*rotation).normalized(),
-        xyz
-    )
+    points = xyz @ _quaternion_to_rotation_matrix(rotation).T
     return points + position
 
 
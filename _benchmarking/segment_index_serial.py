@@ -48,7 +48,8 @@ if __name__ == "__main__":
             print("...")
             break
 
-    # Save results to csv file
-    np.savetxt("query_SI_v6.csv", pos, delimiter=",", fmt="%1.3f")
+    # Save results to a binary .npy file; np.savetxt would pollute the
+    # profile with per-row formatting.
+    np.save("query_SI_v6.npy", pos)
 
     profiler.print_stats()
@@ -61,19 +61,24 @@ def build_query_segment_index(min_corner=[-50, 0, 0], max_corner=[0, 50, 50]):
     print("Number of elements in spherical region:", len(ids))
 
     # Method 2: Get the position only directly from the index as numpy Nx3 (3D positions)
+    # `np.save` writes the raw float data in one go; `np.savetxt` formats
+    # every row in Python and can take seconds for large queries.
     pos = index.box_query(min_corner, max_corner, fields="centroid")
-    np.savetxt("query_SI_v6.csv", pos, delimiter=",", fmt="%1.3f")
-
-    # Method 3, retrieve the tree objects for ids and position
-    found_objects = index.box_query(min_corner, max_corner, fields="raw_elements")
-    for i, obj in enumerate(found_objects):
-        object_ids = obj.ids  # as tuple of gid, section, segment  # noqa
-        # Individual propertioes
-        print("Segment ids:", obj.gid, obj.section_id, obj.segment_id,
-              "Centroid:", obj.centroid)
-        if i >= 20:
-            print("...")
-            break
+    np.save("query_SI_v6.npy", pos)
+
+    # Method 3, retrieve ids and positions as a dictionary of numpy arrays.
+    # Unlike `fields="raw_elements"`, this doesn't create one Python object
+    # per match, so it stays fast for queries with millions of matches and
+    # the fields can be post-processed with vectorized numpy code.
+    results = index.box_query(
+        min_corner, max_corner,
+        fields=["gid", "section_id", "segment_id", "centroid"]
+    )
+    for i in range(min(len(results["gid"]), 20)):
+        print("Segment ids:", results["gid"][i], results["section_id"][i],
+              results["segment_id"][i], "Centroid:", results["centroid"][i])
+    if len(results["gid"]) > 20:
+        print("...")
 
     # Method 4, retrieve all the information in the payload
     # and output them as a dictionary of numpy arrays.
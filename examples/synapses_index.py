@@ -39,13 +39,18 @@ def example_syn_index():
     )
     print("First 10 Z coordinates: ", z_coords[:10])
 
-    # Method #2, get the objects: position and id directly from index
-    objs_in_region = index.box_query(min_corner, max_corner, fields="raw_elements")
-    for i, obj in enumerate(objs_in_region):
-        if i % 20 == 0:
-            print("Sample synapse id:", obj.id, "Position", obj.centroid)
-            print("Post-syn Neuron gid:", obj.post_gid,
-                  "pre-syn Neuron gid:", obj.pre_gid)
+    # Method #2, get ids, positions and gids as a dictionary of numpy
+    # arrays. This doesn't create one Python object per match, so it
+    # stays fast for queries with millions of matches.
+    results = index.box_query(
+        min_corner, max_corner,
+        fields=["id", "position", "post_gid", "pre_gid"]
+    )
+    for i in range(0, len(results["id"]), 20):
+        print("Sample synapse id:", results["id"][i],
+              "Position", results["position"][i])
+        print("Post-syn Neuron gid:", results["post_gid"][i],
+              "pre-syn Neuron gid:", results["pre_gid"][i])
 
     # Method #3, get the information as a dictionary of numpy arrays
     # Information for synapses includes: id, pre_gid, post_gid,
@@ -321,7 +321,7 @@ template<typename Class>
 inline void add_MorphIndex_find_intersecting_box_np(py::class_<Class>& c) {
     auto wrap_results_in_dict = [](const auto& results) {
         auto centroid = py::array_t<CoordType>({results.centroid.size(), 3ul},
-                                                (CoordType*)results.endpoint1.data());
+                                                (CoordType*)results.centroid.data());
         auto endpoint1 = py::array_t<CoordType>({results.endpoint1.size(), 3ul},
                                                 (CoordType*)results.endpoint1.data());
         auto endpoint2 = py::array_t<CoordType>({results.endpoint2.size(), 3ul},
@@ -378,6 +378,40 @@ inline void add_IndexTree_find_nearest_bindings(py::class_<Class>& c) {
             const auto& vec = obj.find_nearest(mk_point(point), k_neighbors);
             return pyutil::to_pyarray(vec);
         }
+    )
+
+    .def("_find_nearest_batch",
+        [](Class& obj, const array_t& points_np, const int k_neighbors) {
+            auto const* const points_ptr =
+                static_cast<Point3Dx const*>(extract_points_ptr(points_np));
+            const auto n_points = util::safe_integer_cast<size_t>(points_np.shape(0));
+
+            // Visit the queries in space filling order: successive queries
+            // are then spatially close and descend through warm parts of
+            // the tree. The results keep the original query order.
+            const auto order = si::experimental::space_filling_order(points_ptr, n_points);
+
+            py::list results(n_points);
+            for (const auto i : order) {
+                // Slice to `Point3D`; only the base is a registered
+                // boost geometry point.
+                const auto& point = static_cast<const point_t&>(points_ptr[i]);
+                const auto& vec = obj.find_nearest(point, k_neighbors);
+                results[i] = pyutil::to_pyarray(vec);
+            }
+
+            return results;
+        },
+        R"(
+        The `k_neighbors` nearest elements for each of the query points.
+
+        Answers all queries behind a single Python/C++ crossing. Returns
+        one array per query point, in the order of the query points.
+
+        Args:
+            points_np(np.array): A Mx3 array[float32] of query points
+            k_neighbors(int): The number of nearest neighbors per query
+        )"
     );
 }
 
@@ -967,6 +1001,61 @@ inline void add_MorphIndex_insert_bindings(py::class_<Class>& c) {
     );
 }
 
+template <typename Class>
+inline void add_MorphIndex_add_segments_bindings(py::class_<Class>& c) {
+    c
+    .def("_add_segments",
+        [](Class& obj, const array_ids& gids,
+                       const array_offsets& section_ids, const array_offsets& segment_ids,
+                       const array_t& p1s, const array_t& p2s,
+                       const array_t& radii, const array_types& section_types) {
+
+            const auto n_segments = util::safe_integer_cast<size_t>(radii.size());
+            if (util::safe_integer_cast<size_t>(gids.size()) != n_segments
+                    || util::safe_integer_cast<size_t>(section_ids.size()) != n_segments
+                    || util::safe_integer_cast<size_t>(segment_ids.size()) != n_segments
+                    || util::safe_integer_cast<size_t>(p1s.shape(0)) != n_segments
+                    || util::safe_integer_cast<size_t>(p2s.shape(0)) != n_segments
+                    || util::safe_integer_cast<size_t>(section_types.size()) != n_segments) {
+                throw py::value_error(
+                    "Please provide exactly one gid, section_id, segment_id,"
+                    " p1, p2, radius and section_type per segment."
+                );
+            }
+
+            auto [p1s_ptr, radii_ptr] = extract_points_radii_ptrs(p1s, radii);
+            auto const* const p2s_ptr = extract_points_ptr(p2s);
+            auto const* const gids_ptr = extract_ids_ptr(gids);
+            auto const* const section_ids_ptr = extract_offsets_ptr(section_ids);
+            auto const* const segment_ids_ptr = extract_offsets_ptr(segment_ids);
+            auto const* const section_types_ptr = extract_section_types_ptr(section_types);
+
+            for (size_t i = 0; i < n_segments; ++i) {
+                obj.insert(si::Segment{
+                    gids_ptr[i], section_ids_ptr[i], segment_ids_ptr[i],
+                    p1s_ptr[i], p2s_ptr[i], radii_ptr[i],
+                    static_cast<SectionType>(section_types_ptr[i])
+                });
+            }
+        },
+        R"(
+        Bulk add segments given as SoA arrays.
+
+        Unlike `_insert`, this crosses the Python/C++ boundary once for
+        the whole batch of segments.
+
+        Args:
+            gids(np.array): An array[int64] with the ids of the neurons
+            section_ids(np.array): An array[uint32] with the section ids
+            segment_ids(np.array): An array[uint32] with the segment ids
+            p1s(np.array): A Nx3 array[float32] of the cylinders' first points
+            p2s(np.array): A Nx3 array[float32] of the cylinders' second points
+            radii(np.array): An array[float32] with the cylinders' radii
+            section_types(np.array): An array[uint32] with the section types
+        )"
+    );
+}
+
 template <typename Class>
 inline void add_MorphIndex_place_bindings(py::class_<Class>& c) {
     c
@@ -1218,6 +1307,7 @@ template <typename Class>
 inline void add_MorphIndex_common_insert_bindings(py::class_<Class>& c) {
     add_IndexTree_insert_bindings<MorphoEntry, si::Soma, Class>(c);
     add_MorphIndex_insert_bindings<Class>(c);
+    add_MorphIndex_add_segments_bindings<Class>(c);
 
     add_MorphIndex_add_branch_bindings<Class>(c);
     add_MorphIndex_add_neuron_bindings<Class>(c);
@@ -1304,6 +1394,7 @@ inline void create_MorphIndexBulkBuilder_bindings(py::module& m, const char* cla
     auto c = create_IndexBulkBuilder_bindings<Class>(m, class_name);
 
     add_MorphIndex_common_insert_bindings<Class>(c);
+    add_IndexTree_add_spheres_bindings<MorphoEntry, si::Soma, Class>(c);
 }
 
 template <typename Class = si::IndexBulkBuilder<si::IndexTree<Synapse>>>
@@ -1392,6 +1483,7 @@ inline void create_MorphMultiIndexBulkBuilder_bindings(py::module& m, const char
     py::class_<Class> c = create_MultiIndexBulkBuilder_bindings<MorphoEntry>(m, class_name);
 
     add_MorphIndex_common_insert_bindings<Class>(c);
+    add_IndexTree_add_spheres_bindings<MorphoEntry, si::Soma, Class>(c);
 }
 
 
@@ -1,6 +1,7 @@
 """ brain_indexer classes """
+import importlib
 import logging
-from importlib.metadata import version
+from importlib.metadata import PackageNotFoundError, version
 
 from . import _brain_indexer as core  # noqa
 
@@ -8,7 +9,7 @@ __copyright__ = "2019 Blue Brain Project, EPFL"
 
 try:
     __version__ = version("brain-indexer")
-except Exception:
+except PackageNotFoundError:
     __version__ = 'devel'
 
 
@@ -26,10 +27,47 @@ register_logger(logging.getLogger(__name__))
 
 from ._brain_indexer import SectionType # noqa
 
-try:
-    from .morphology_builder import MorphMultiIndexBuilder  # noqa
-    from .synapse_builder import SynapseMultiIndexBuilder  # noqa
-except ImportError:
+from .index import SynapseIndex, SynapseMultiIndex  # noqa
+from .index import MorphIndex, MorphMultiIndex  # noqa
+from .index import SphereIndex, PointIndex  # noqa
+from .index import MultiPopulationIndex  # noqa
+
+from .resolver import IndexResolver, SynapseIndexResolver, MorphIndexResolver  # noqa
+from .resolver import SphereIndexResolver, PointIndexResolver  # noqa
+from .resolver import open_index  # noqa
+
+
+# The builders pull in the build-time dependencies, e.g. morphio. Users
+# opening an existing index shouldn't pay for importing them, hence the
+# builders are imported lazily (PEP 562).
+_LAZY_BUILDER_MODULES = {
+    "MorphIndexBuilder": ".morphology_builder",
+    "MorphMultiIndexBuilder": ".morphology_builder",
+    "SynapseIndexBuilder": ".synapse_builder",
+    "SynapseMultiIndexBuilder": ".synapse_builder",
+    "SphereIndexBuilder": ".builder",
+    "PointIndexBuilder": ".builder",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_BUILDER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(module_name, __name__)
+    try:
+        return getattr(module, name)
+    except AttributeError:
+        # Only the multi-index builders can be missing, i.e. when the C++
+        # backend was compiled without MPI support.
+        _warn_multi_index_builders_disabled()
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+
+def _warn_multi_index_builders_disabled():
     import textwrap
     logger.warning(
         "\n".join(textwrap.wrap(
@@ -41,16 +79,3 @@ except ImportError:
             " or directly from source."
         ))
     )
-
-from .morphology_builder import MorphIndexBuilder  # noqa
-from .synapse_builder import SynapseIndexBuilder  # noqa
-from .builder import SphereIndexBuilder, PointIndexBuilder  # noqa
-
-from .index import SynapseIndex, SynapseMultiIndex  # noqa
-from .index import MorphIndex, MorphMultiIndex  # noqa
-from .index import SphereIndex, PointIndex  # noqa
-from .index import MultiPopulationIndex  # noqa
-
-from .resolver import IndexResolver, SynapseIndexResolver, MorphIndexResolver  # noqa
-from .resolver import SphereIndexResolver, PointIndexResolver  # noqa
-from .resolver import open_index  # noqa
@@ -0,0 +1,39 @@
+"""Optional Numba kernels used by the builders.
+
+Numba is not a dependency of brain-indexer. When it's available, the
+builders dispatch a few small per-cell hot loops to the JIT compiled
+kernels in this module; otherwise they fall back to pure NumPy. The
+kernels must therefore mirror their NumPy counterparts exactly.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _rototranslate(points, quat, position, out):
+    """Write `points` rotated by `quat` and shifted by `position` into `out`.
+
+    The quaternion `quat` is given in the order (w, x, y, z) and doesn't
+    need to be normalized. See `_quaternion_to_rotation_matrix` in
+    `morphology_builder.py` for the NumPy equivalent.
+    """
+    w, x, y, z = quat[0], quat[1], quat[2], quat[3]
+    s = 2.0 / (w * w + x * x + y * y + z * z)
+
+    r00, r01, r02 = 1.0 - s * (y * y + z * z), s * (x * y - z * w), s * (x * z + y * w)
+    r10, r11, r12 = s * (x * y + z * w), 1.0 - s * (x * x + z * z), s * (y * z - x * w)
+    r20, r21, r22 = s * (x * z - y * w), s * (y * z + x * w), 1.0 - s * (x * x + y * y)
+
+    for i in range(points.shape[0]):
+        px, py, pz = points[i, 0], points[i, 1], points[i, 2]
+        out[i, 0] = r00 * px + r01 * py + r02 * pz + position[0]
+        out[i, 1] = r10 * px + r11 * py + r12 * pz + position[1]
+        out[i, 2] = r20 * px + r21 * py + r22 * pz + position[2]
+
+
+if njit is not None:
+    rototranslate = njit(cache=True, fastmath=True)(_rototranslate)
+else:
+    rototranslate = None
@@ -1,13 +1,15 @@
 import warnings; warnings.simplefilter("ignore")  # NOQA
 
+import os
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
-import morphio
+import libsonata
 import numpy as np
-import quaternion as npq
 
 import brain_indexer
 from . import _brain_indexer as core
+from . import _numba_kernels
 from . import logger
 
 from .builder import _WriteSONATAMetadataMixin, _WriteSONATAMetadataMultiMixin
@@ -16,31 +18,151 @@ from .index import MorphIndex
 from .io import open_sonata_nodes, validated_sonata_nodes_population_name
 
 
-morphio.set_ignored_warning(morphio.Warning.only_child)
 MorphInfo = namedtuple("MorphInfo", "soma, points, radius, branch_offsets, section_type")
 
 
+class _MorphologyCache(dict):
+    """A dict of `MorphInfo` that loads missing morphologies on lookup.
+
+    `__missing__` fuses the lookup and the load into a single hash probe,
+    i.e. `cache[name]` either hits or triggers exactly one load.
+    """
+
+    def __init__(self, loader):
+        super().__init__()
+        self._loader = loader
+
+    def __missing__(self, morph_name):
+        morph_info = self._loader(morph_name)
+        self[morph_name] = morph_info
+        return morph_info
+
+
+def _quaternion_to_rotation_matrix(quat):
+    """The rotation matrix of a quaternion given as ``(w, x, y, z)``.
+
+    The quaternion doesn't need to be normalized, since the normalization
+    is absorbed into the matrix.
+    """
+    w, x, y, z = quat
+    s = 2.0 / np.dot(quat, quat)
+
+    return np.array([
+        [1.0 - s * (y * y + z * z), s * (x * y - z * w), s * (x * z + y * w)],
+        [s * (x * y + z * w), 1.0 - s * (x * x + z * z), s * (y * z - x * w)],
+        [s * (x * z - y * w), s * (y * z + x * w), 1.0 - s * (x * x + y * y)],
+    ])
+
+
+def _quaternions_to_rotation_matrices(quats):
+    """Vectorized `_quaternion_to_rotation_matrix` for a `(C, 4)` array."""
+    w, x, y, z = quats.T
+    s = 2.0 / np.einsum("ij,ij->i", quats, quats)
+
+    matrices = np.empty(quats.shape[:1] + (3, 3))
+    matrices[:, 0, 0] = 1.0 - s * (y * y + z * z)
+    matrices[:, 0, 1] = s * (x * y - z * w)
+    matrices[:, 0, 2] = s * (x * z + y * w)
+    matrices[:, 1, 0] = s * (x * y + z * w)
+    matrices[:, 1, 1] = 1.0 - s * (x * x + z * z)
+    matrices[:, 1, 2] = s * (y * z - x * w)
+    matrices[:, 2, 0] = s * (x * z - y * w)
+    matrices[:, 2, 1] = s * (y * z + x * w)
+    matrices[:, 2, 2] = 1.0 - s * (x * x + y * y)
+
+    return matrices
+
+
+def _transform_points(points, position, rotation, out=None):
+    """Rotate, then translate `points` without modifying them inplace.
+
+    The result is written to `out` when given, which allows reusing one
+    scratch buffer across cells.
+    """
+    if out is None:
+        out = np.empty_like(points)
+
+    if rotation is not None:
+        if _numba_kernels.rototranslate is not None:
+            # For the many small morphologies the JIT compiled loop wins
+            # over a matmul, since it fuses rotation and translation and
+            # avoids the intermediate array.
+            _numba_kernels.rototranslate(points, rotation, position, out)
+            return out
+
+        # Rotating all points at once through the rotation matrix
+        # keeps this a single (N, 3) x (3, 3) matmul.
+        rotation_matrix = _quaternion_to_rotation_matrix(rotation)
+        rotation_matrix = rotation_matrix.astype(points.dtype)
+        np.matmul(points, rotation_matrix.T, out=out)
+        out += position
+
+    else:
+        # Don't modify morphology-db points inplace, i.e. never `+=`.
+        np.add(points, position, out=out, casting="same_kind")
+
+    return out
+
+
 class MorphologyLib:
     def __init__(self, collection_path):
+        # morphio is only needed when building an index; importing it
+        # lazily keeps `import brain_indexer` light for query-only users.
+        import morphio
+        morphio.set_ignored_warning(morphio.Warning.only_child)
+
         self._collection = morphio.Collection(collection_path)
-        self._morphologies = {}
+        self._morphologies = _MorphologyCache(self._load)
+
+        # Concurrent loads are only safe when every morphology is its own
+        # file. A single `.h5` container is read through one HDF5 handle
+        # and HDF5 isn't thread-safe.
+        self._can_load_concurrently = os.path.isdir(collection_path)
 
     def _load(self, morph_name):
         morph = self._collection.load(morph_name)
 
         soma = morph.soma
-        morph_infos = MorphInfo(
+
+        # Coerce everything to the contiguous dtypes the core expects once
+        # at load time, so no hidden copies happen at the pybind11 boundary
+        # for every cell sharing this morphology.
+        points = np.ascontiguousarray(morph.points, dtype=np.float32)
+        radius = 0.5 * np.ascontiguousarray(morph.diameters, dtype=np.float32)
+        branch_offsets = np.ascontiguousarray(
+            morph.section_offsets[:-1], dtype=np.uint32
+        )
+        section_type = np.ascontiguousarray(morph.section_types, dtype=np.uint32)
+
+        # These arrays are shared by all cells with this morphology.
+        for array in (points, radius, branch_offsets, section_type):
+            array.setflags(write=False)
+
+        return MorphInfo(
             soma=(soma.center, soma.max_distance),
-            points=morph.points,
-            radius=morph.diameters / 2.,
-            branch_offsets=morph.section_offsets,
-            section_type=morph.section_types,
+            points=points,
+            radius=radius,
+            branch_offsets=branch_offsets,
+            section_type=section_type,
         )
-        self._morphologies[morph_name] = morph_infos
-        return morph_infos
 
     def get(self, morph_name):
-        return self._morphologies.get(morph_name) or self._load(morph_name)
+        return self._morphologies[morph_name]
+
+    def get_many(self, morph_names):
+        """Returns the `MorphInfo` of every name in `morph_names`.
+
+        Cache misses are loaded through a small thread pool. Reading
+        morphologies is dominated by I/O and work inside morphio, both of
+        which release the GIL; so the loads overlap nicely.
+        """
+        missing = [name for name in morph_names if name not in self._morphologies]
+        if self._can_load_concurrently and len(missing) > 1:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                # Consume the iterator, so exceptions surface here.
+                list(executor.map(self.get, missing))
+
+        return [self.get(name) for name in morph_names]
 
 
 class MorphIndexBuilderBase:
@@ -66,38 +188,60 @@ class MorphIndexBuilderBase:
         self._gids = gids
 
         self.morph_lib = MorphologyLib(morphology_dir)
+        self._points_buf = np.empty((0, 3), dtype=np.float32)
         brain_indexer.logger.info("Number of neurons to index: %d", len(gids))
 
     def n_elements_to_import(self):
         return len(self._gids)
 
     def rototranslate(self, morph, position, rotation):
-        # npq requires quaternion in the order: (w, x, y, z)
+        """Returns the `MorphInfo` and the transformed points of `morph`.
 
+        The quaternion `rotation` is given in the order: (w, x, y, z).
+        """
         morph = self.morph_lib.get(morph)
-        if rotation is not None:
-            points = npq.rotate_vectors(
-                npq.quaternion(*rotation).normalized(),
-                morph.points
-            )
+        return morph, _transform_points(morph.points, position, rotation)
 
-            points += position
+    def _batch_transform_points(self, points, positions, rotation_matrices):
+        """Rotate and translate one morphology's points for several cells.
 
-        else:
-            # Don't modify morphology-db points inplace, i.e. never `+=`.
-            points = morph.points + position
+        With `rotation_matrices=None` the points are only translated.
+        Returns a `(n_cells, n_points, 3)` view into the scratch buffer.
+        """
+        n_cells, n_points = len(positions), len(points)
+
+        out = self._points_scratch(n_cells * n_points)
+        out = out.reshape(n_cells, n_points, 3)
+
+        if rotation_matrices is None:
+            np.add(points, positions[:, None, :], out=out, casting="same_kind")
+            return out
+
+        rotation_matrices = rotation_matrices.astype(points.dtype)
+        np.matmul(points, rotation_matrices.transpose(0, 2, 1), out=out)
+        out += positions[:, None, :]
 
-        return points
+        return out
+
+    def _points_scratch(self, n_points):
+        """A reusable `(n_points, 3)` scratch buffer.
+
+        The core index copies everything it's handed, so the buffer can be
+        reused for the next cell right after `process_cell` returns.
+        """
+        if self._points_buf.shape[0] < n_points:
+            self._points_buf = np.empty((n_points, 3), dtype=np.float32)
+
+        return self._points_buf[:n_points]
 
     def process_cell(self, gid, morph, points, position):
-        """ Process (index) a single cell
+        """ Process (index) a single cell given its `MorphInfo`
         """
-        morph = self.morph_lib.get(morph)
         soma_center, soma_rad = morph.soma
         soma_center = soma_center + position  # Avoid +=
         self._core_builder._add_soma(gid, soma_center, soma_rad)
         self._core_builder._add_neuron(
-            gid, points, morph.radius, morph.branch_offsets[:-1],
+            gid, points, morph.radius, morph.branch_offsets,
             morph.section_type, False
         )
 
@@ -108,23 +252,64 @@ class MorphIndexBuilderBase:
         """
         slice_ = slice(*sub_range)
         cur_gids = self._gids[slice_]
+        if len(cur_gids) == 0:
+            return
+
+        if isinstance(cur_gids, range) and cur_gids.step == 1:
+            # When indexing all GIDs, `_gids` stays a `range`; its slice is
+            # trivially contiguous and needs no materialized array.
+            selection = libsonata.Selection([(cur_gids.start, cur_gids.stop)])
+        else:
+            selection = libsonata.Selection(np.asarray(cur_gids, dtype=np.int64))
 
         sonata_nodes = self._sonata_nodes
-        for gid in cur_gids:
-            morph_name = sonata_nodes.get_attribute("morphology", gid)
+        morph_names = np.asarray(
+            sonata_nodes.get_attribute("morphology", selection)
+        )
+        positions = np.column_stack(
+            [sonata_nodes.get_attribute(key, selection) for key in ["x", "y", "z"]]
+        )
+        rotations = np.column_stack([
+            sonata_nodes.get_attribute(f"orientation_{key}", selection)
+            for key in ["w", "x", "y", "z"]
+        ])
+
+        # A circuit shares few morphologies among many cells. Load each
+        # unique name once and index into the palette, instead of probing
+        # the string-keyed cache for every cell.
+        unique_morphs, inverse = np.unique(morph_names, return_inverse=True)
+        morph_table = self.morph_lib.get_many(unique_morphs)
+
+        # Circuits, e.g. test circuits, may store identity orientations
+        # throughout; those ranges bypass the rotation machinery entirely.
+        if np.all(rotations[:, 1:] == 0.0) and np.all(rotations[:, 0] != 0.0):
+            rotation_matrices = None
+        else:
+            rotation_matrices = _quaternions_to_rotation_matrices(rotations)
 
-            pos_keys = ["x", "y", "z"]
-            pos = np.array(
-                [sonata_nodes.get_attribute(key, gid) for key in pos_keys]
-            )
+        gids = np.asarray(cur_gids, dtype=np.int64)
+        soma_centers = np.empty((len(gids), 3), dtype=np.float32)
+        soma_radii = np.empty(len(gids), dtype=np.float32)
 
-            orientation_keys = [f"orientation_{key}" for key in ["w", "x", "y", "z"]]
-            rot = np.array(
-                [sonata_nodes.get_attribute(key, gid) for key in orientation_keys]
-            )
+        for k, morph in enumerate(morph_table):
+            # All cells sharing a morphology are rotated with a single
+            # batched (P, 3) x (C, 3, 3) matmul.
+            cells = np.nonzero(inverse == k)[0]
+            soma_centers[cells], soma_radii[cells] = morph.soma
 
-            rotopoints = self.rototranslate(morph_name, pos, rot)
-            self.process_cell(gid, morph_name, rotopoints, pos)
+            points = self._batch_transform_points(
+                morph.points, positions[cells],
+                None if rotation_matrices is None else rotation_matrices[cells],
+            )
+            for c, i in enumerate(cells):
+                self._core_builder._add_neuron(
+                    gids[i], points[c], morph.radius, morph.branch_offsets,
+                    morph.section_type, False
+                )
+
+        # The somas of the whole range cross the FFI boundary in one call.
+        soma_centers += positions
+        self._core_builder._add_spheres(soma_centers, soma_radii, gids)
 
     @classmethod
     def from_sonata_file(cls, morphology_dir, node_filename, pop_name, gids=None,
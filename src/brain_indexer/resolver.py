@@ -1,10 +1,5 @@
 from brain_indexer import core
 
-from .morphology_builder import MorphIndexBuilder
-from .synapse_builder import SynapseIndexBuilder
-
-from .builder import SphereIndexBuilder, PointIndexBuilder
-
 from .index import MorphIndex, MorphMultiIndex
 from .index import SynapseIndex, SynapseMultiIndex
 from .index import SphereIndex, PointIndex
@@ -34,10 +29,7 @@ class _SingleKindIndexResolverBase:
     @classmethod
     def builder_class(cls, index_variant):
         """The builder required to build the index."""
-        if index_variant not in cls._builder_classes:
-            raise ValueError(f"Invalid index_variant: {index_variant}")
-
-        return cls._resolve(index_variant, classes=cls._builder_classes)
+        return cls._resolve(index_variant, classes=cls._builder_classes())
 
 
 class PointIndexResolver(_SingleKindIndexResolverBase):
@@ -53,9 +45,15 @@ class PointIndexResolver(_SingleKindIndexResolverBase):
         core._MetaDataConstants.in_memory_key: PointIndex,
     }
 
-    _builder_classes = {
-        core._MetaDataConstants.in_memory_key: PointIndexBuilder,
-    }
+    @classmethod
+    def _builder_classes(cls):
+        # Builders pull in the build-time dependencies; import them only
+        # when a builder is actually requested.
+        from .builder import PointIndexBuilder
+
+        return {
+            core._MetaDataConstants.in_memory_key: PointIndexBuilder,
+        }
 
 
 class SphereIndexResolver(_SingleKindIndexResolverBase):
@@ -71,9 +69,13 @@ class SphereIndexResolver(_SingleKindIndexResolverBase):
         core._MetaDataConstants.in_memory_key: SphereIndex,
     }
 
-    _builder_classes = {
-        core._MetaDataConstants.in_memory_key: SphereIndexBuilder,
-    }
+    @classmethod
+    def _builder_classes(cls):
+        from .builder import SphereIndexBuilder
+
+        return {
+            core._MetaDataConstants.in_memory_key: SphereIndexBuilder,
+        }
 
 
 class SynapseIndexResolver(_SingleKindIndexResolverBase):
@@ -81,12 +83,6 @@ class SynapseIndexResolver(_SingleKindIndexResolverBase):
 
     This class is for all classes related to indexes of synapses.
     """
-    try:
-        from .synapse_builder import SynapseMultiIndexBuilder  # noqa
-        si_has_mpi = True
-    except ImportError:
-        si_has_mpi = False
-
     _core_classes = {
         core._MetaDataConstants.in_memory_key: core.SynapseIndex,
         core._MetaDataConstants.multi_index_key: core.SynapseMultiIndex,
@@ -97,13 +93,21 @@ class SynapseIndexResolver(_SingleKindIndexResolverBase):
         core._MetaDataConstants.multi_index_key: SynapseMultiIndex,
     }
 
-    _builder_classes = {
-        core._MetaDataConstants.in_memory_key: SynapseIndexBuilder,
-    }
+    @classmethod
+    def _builder_classes(cls):
+        from .synapse_builder import SynapseIndexBuilder
 
-    if si_has_mpi:
-        key = core._MetaDataConstants.multi_index_key
-        _builder_classes[key] = SynapseMultiIndexBuilder
+        classes = {
+            core._MetaDataConstants.in_memory_key: SynapseIndexBuilder,
+        }
+
+        try:
+            from .synapse_builder import SynapseMultiIndexBuilder
+            classes[core._MetaDataConstants.multi_index_key] = SynapseMultiIndexBuilder
+        except ImportError:
+            pass
+
+        return classes
 
 
 class MorphIndexResolver(_SingleKindIndexResolverBase):
@@ -111,13 +115,6 @@ class MorphIndexResolver(_SingleKindIndexResolverBase):
 
     This class is for all classes related to indexes of morphologies.
     """
-    try:
-        from .morphology_builder import MorphMultiIndexBuilder  # noqa
-        si_has_mpi = True
-    except ImportError:
-        MorphMultiIndexBuilder = None
-        si_has_mpi = False
-
     _core_classes = {
         core._MetaDataConstants.in_memory_key: core.MorphIndex,
         core._MetaDataConstants.multi_index_key: core.MorphMultiIndex,
@@ -128,13 +125,21 @@ class MorphIndexResolver(_SingleKindIndexResolverBase):
         core._MetaDataConstants.multi_index_key: MorphMultiIndex,
     }
 
-    _builder_classes = {
-        core._MetaDataConstants.in_memory_key: MorphIndexBuilder,
-    }
+    @classmethod
+    def _builder_classes(cls):
+        from .morphology_builder import MorphIndexBuilder
+
+        classes = {
+            core._MetaDataConstants.in_memory_key: MorphIndexBuilder,
+        }
 
-    if si_has_mpi:
-        key = core._MetaDataConstants.multi_index_key
-        _builder_classes[key] = MorphMultiIndexBuilder
+        try:
+            from .morphology_builder import MorphMultiIndexBuilder
+            classes[core._MetaDataConstants.multi_index_key] = MorphMultiIndexBuilder
+        except ImportError:
+            pass
+
+        return classes
 
 
 class IndexResolver:
@@ -161,17 +166,28 @@ class IndexResolver:
     @staticmethod
     def index_class(element_type, index_variant):
         """The high-level user facing class."""
-        return IndexResolver._resolve(element_type, index_variant, "index_class")
+        return IndexResolver._lookup(element_type, index_variant, "index")
 
     @staticmethod
     def builder_class(element_type, index_variant):
         """The builder required to build the index."""
+        # Builders are resolved through the per-kind resolvers, since
+        # they're imported lazily.
         return IndexResolver._resolve(element_type, index_variant, "builder_class")
 
     @staticmethod
     def core_class(element_type, index_variant):
         """The low-level C++ wrapper."""
-        return IndexResolver._resolve(element_type, index_variant, "core_class")
+        return IndexResolver._lookup(element_type, index_variant, "core")
+
+    @staticmethod
+    def _lookup(element_type, index_variant, kind):
+        try:
+            return _FLAT_CLASSES[(element_type, index_variant, kind)]
+        except KeyError:
+            # Resolve again through the per-kind resolvers, for their
+            # error reporting.
+            return IndexResolver._resolve(element_type, index_variant, kind + "_class")
 
     @staticmethod
     def _resolve(element_type, index_variant, method):
@@ -179,6 +195,20 @@ class IndexResolver:
         return getattr(Resolver, method)(index_variant)
 
 
+# The full cross-product of (element_type, index_variant, kind), so the
+# common lookups are a single hash probe instead of a chain of class and
+# attribute resolutions. Builders are excluded; they import lazily.
+_FLAT_CLASSES = {
+    (element_type, index_variant, kind): cls
+    for element_type, Resolver in IndexResolver._resolver_classes.items()
+    for kind, classes in [
+        ("index", Resolver._index_classes),
+        ("core", Resolver._core_classes),
+    ]
+    for index_variant, cls in classes.items()
+}
+
+
 def _open_single_population_index(meta_data, **kwargs):
     Index = IndexResolver.from_meta_data(meta_data)
     return Index.from_meta_data(meta_data, **kwargs)
@@ -6,9 +6,9 @@ import os
 import numpy.testing as nptest
 
 from brain_indexer.morphology_builder import MorphIndexBuilder
+from brain_indexer.morphology_builder import _quaternion_to_rotation_matrix
 
 import morphio
-import quaternion as npq
 import libsonata
 try:
     import pytest
@@ -33,10 +33,11 @@ class _3DMorphology:
         """ The kernel used to compute final positions, inspiring the final impl.
             We test it against known data (test_morph_loading) and against the core impl.
         """
-        rot_quat = npq.quaternion(self.rotation[3], *self.rotation[:3]).normalized()
+        x, y, z, w = self.rotation
+        rot_matrix = _quaternion_to_rotation_matrix((w, x, y, z))
         soma_pts = self.translation  # by definition soma is at 0,0,0
         soma_rad = self.morph.soma.max_distance
-        section_pts = npq.rotate_vectors(rot_quat, self.morph.points) + self.translation
+        section_pts = self.morph.points @ rot_matrix.T + self.translation
         return soma_pts, soma_rad, section_pts
 
 
@@ -4,33 +4,39 @@ Python tests to the morphology spatial index.
 It reuses tests from test_rthree_sphere
 """
 import numpy as np
-import os.path
-import sys
 import pytest
 
 from brain_indexer import core
 from brain_indexer import MorphIndex, SectionType
 
-# Add this dir to path so we can import the other tests
-sys.path.append(os.path.abspath(os.path.dirname(__file__)))
-import test_rtree_sphere  # NOQA
+from . import test_rtree_sphere
 
 
 def test_morphos_insert():
-    c1 = test_rtree_sphere.arange_centroids(10)
-    c2 = test_rtree_sphere.arange_centroids(10)
+    N = 10
+    c1 = test_rtree_sphere.arange_centroids(N)
+    c2 = test_rtree_sphere.arange_centroids(N)
     c2[:, 1] += 2
-    radii = np.full(10, 0.5, dtype=np.float32)
+    radii = np.full(N, 0.5, dtype=np.float32)
+
+    gids = np.arange(N, dtype=np.intp) // 4
+    section_ids = np.arange(N, dtype=np.uint32) % 4
+    segment_ids = np.arange(N, dtype=np.uint32) % 4
+    types = np.full(N, SectionType.undefined, dtype=np.uint32)
 
     t = core.MorphIndex()
-    for i in range(len(c1)):
-        t._insert(i // 4, i % 4, i % 4, c1[i], c2[i], radii[i],
-                  SectionType.undefined)
+    t._add_segments(gids, section_ids, segment_ids, c1, c2, radii, types)
 
     for i, c in enumerate(c1):
         idx = t._find_nearest(c, 1)[0]
         assert idx[0] == (i // 4) and idx[1] == (i % 4), "i={}, idx={} ".format(i, idx)
 
+    # Batched nearest queries answer all points in one call and return
+    # the results in query order.
+    for i, idx in enumerate(t._find_nearest_batch(c1, 1)):
+        idx = idx[0]
+        assert idx[0] == (i // 4) and idx[1] == (i % 4), "i={}, idx={} ".format(i, idx)
+
 
 def test_bulk_single_segments_no_soma():
     """
@@ -41,18 +47,19 @@ def test_bulk_single_segments_no_soma():
     """
 
     n_sections = 3
+    # Exactly the dtypes of the core, so ingestion is zero-copy.
     points = np.array([
         3 * [1.0], 3 * [1.1],
         3 * [2.0], 3 * [2.1],
         3 * [3.0], 3 * [3.1],
-    ])
+    ], dtype=np.float32)
 
     n_points = points.shape[0]
     assert n_points == 2 * n_sections, "Broken internal test logic."
 
-    offsets = np.array(range(0, n_points, 2))
-    radii = np.arange(n_points)  # Fake piecewise linear radii
-    types = np.full(len(points), SectionType.undefined)
+    offsets = np.arange(0, n_points, 2, dtype=np.uint32)
+    radii = np.arange(n_points, dtype=np.float32)  # Fake piecewise linear radii
+    types = np.full(len(points), SectionType.undefined, dtype=np.uint32)
 
     rtree = core.MorphIndex()
     rtree._add_neuron(0, points, radii, offsets, types, has_soma=False)
@@ -74,16 +81,16 @@ def test_bulk_single_segments_with_soma():
         3 * [1.0], 3 * [1.1],
         3 * [2.0], 3 * [2.1],
         3 * [3.0], 3 * [3.1],
-    ])
+    ], dtype=np.float32)
 
     n_points = points.shape[0]
     n_elements = n_sections + 1
 
     assert n_points == 2 * n_sections + 1, "Broken internal test logic."
 
-    offsets = np.array([0] + list(range(1, n_points, 2)))
-    radii = np.arange(n_points)  # Fake piecewise linear radii.
-    types = np.full(n_points, SectionType.undefined)
+    offsets = np.array([0] + list(range(1, n_points, 2)), dtype=np.uint32)
+    radii = np.arange(n_points, dtype=np.float32)  # Fake piecewise linear radii.
+    types = np.full(n_points, SectionType.undefined, dtype=np.uint32)
 
     rtree = core.MorphIndex()
     rtree._add_neuron(0, points, radii, offsets, types, has_soma=True)
@@ -106,10 +113,11 @@ def test_bulk_neuron_add():
     points[:, 0] = np.concatenate((np.arange(10), np.arange(4, 10)))
     points[10:, 1] = 1
     radius = np.ones(N, dtype=np.float32)
-    types = np.full(N, SectionType.undefined)
+    offsets = np.array([1, 10], dtype=np.uint32)
+    types = np.full(N, SectionType.undefined, dtype=np.uint32)
 
     rtree = core.MorphIndex()
-    rtree._add_neuron(nrn_id, points, radius, [1, 10], types)
+    rtree._add_neuron(nrn_id, points, radius, offsets, types)
 
     # around a point, expect 4 segments, 2 from branch 1, 2 from branch 2
     COORD_SEARCH = [5, 0, 0]
@@ -122,15 +130,23 @@ def test_bulk_neuron_add():
 
     # New API
     index = MorphIndex(rtree)
-    objs = index.box_query(
-        [COORD_SEARCH[0] - 0.9, -.1, -.1],
-        [COORD_SEARCH[0] + 0.9, .1, .1],
-        fields="raw_elements"
-    )
+    min_corner = [COORD_SEARCH[0] - 0.9, -.1, -.1]
+    max_corner = [COORD_SEARCH[0] + 0.9, .1, .1]
+
+    objs = index.box_query(min_corner, max_corner, fields="raw_elements")
     assert len(objs) == len(EXPECTED_IDS)
     for obj in objs:
         assert (obj.gid, obj.section_id, obj.segment_id) in EXPECTED_IDS
 
+    # The same query as SoA numpy arrays, i.e. without materializing one
+    # Python object per match.
+    results = index.box_query(
+        min_corner, max_corner,
+        fields=["gid", "section_id", "segment_id"]
+    )
+    actual_ids = set(zip(results["gid"], results["section_id"], results["segment_id"]))
+    assert actual_ids == EXPECTED_IDS
+
 
 def test_add_neuron_with_soma_and_toString():
     points = [
@@ -214,6 +230,14 @@ def test_endpoints_retrieval():
     assert idx[0].endpoints is None
     np.testing.assert_allclose(idx[1].endpoints, array_expect)
 
+    # The dict query materializes ids and endpoints in one traversal,
+    # without the per-object endpoint arrays of `raw_elements`.
+    results = index.box_query(min_corner, max_corner, fields=["endpoints", "is_soma"])
+    endpoints1, endpoints2 = results["endpoints"]
+    assert results["is_soma"][0] and not results["is_soma"][1]
+    np.testing.assert_allclose(endpoints1[1], array_expect[0])
+    np.testing.assert_allclose(endpoints2[1], array_expect[1])
+
 
 def test_section_type_retrieval():
     # This test creates a small artificial circuit